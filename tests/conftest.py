@@ -0,0 +1,58 @@
+"""
+Shared fixtures for the Mergington High School API tests
+"""
+
+import json
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+
+from app import app, activities
+
+# Snapshot of the app's initial activities; json.loads yields a fresh deep copy
+# faster than copy.deepcopy
+_ORIGINAL_ACTIVITIES_JSON = json.dumps(activities)
+# Seed participants per activity as sets, for O(1) membership checks
+_ORIGINAL_PARTICIPANT_SETS = {
+    name: frozenset(info["participants"]) for name, info in activities.items()
+}
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a test client for the FastAPI app"""
+    # Entering the client runs the ASGI lifespan once and keeps one portal for all requests
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest_asyncio.fixture
+async def async_client():
+    """Create an async client for issuing concurrent requests to the FastAPI app"""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup_app(client):
+    """Prime FastAPI's lazy route and response caches before the first test"""
+    assert client.get("/activities").status_code == 200
+
+
+@pytest.fixture(scope="session")
+def original_participants():
+    """Seed participants of each activity as sets"""
+    return _ORIGINAL_PARTICIPANT_SETS
+
+
+@pytest.fixture
+def reset_activities():
+    """Restore activities to initial state after a mutating test"""
+    # Only mutating tests request this fixture, so restoring on teardown keeps
+    # the shared state pristine for every test that runs without it
+    yield
+    
+    # Clear and reset activities
+    activities.clear()
+    activities.update(json.loads(_ORIGINAL_ACTIVITIES_JSON))